@@ -4,20 +4,33 @@
 from __future__ import annotations
 
 import argparse
+import io
 import json
+import os
 import re
-from dataclasses import asdict, dataclass
+import sys
+from dataclasses import dataclass
 from pathlib import Path
 
 IGNORE_DIRS = {'.git', 'node_modules', 'dist', 'build', 'out', 'coverage'}
-CODE_EXTENSIONS = {'.ts', '.js'}
+CODE_EXTENSIONS = ('.ts', '.js')
 CATEGORY_ORDER = ['specs', 'pages', 'elements', 'data', 'utils', 'other']
-UTILS_TOKEN_RE = re.compile(r'(^|[-_.])(util|utils|helper|helpers)([-_.]|$)')
-ELEMENTS_TOKEN_RE = re.compile(r'(^|[-_.])(element|elements)([-_.]|$)')
-PAGES_TOKEN_RE = re.compile(r'(^|[-_.])(page|list-page|form-page)([-_.]|$)')
-
-
-@dataclass
+# Single alternation replacing four per-file regex searches; branches are
+# tried left to right from the start of the name, so group order encodes the
+# classification priority and match() preserves it (search() would not).
+CLASSIFY_NAME_RE = re.compile(
+    r'(?P<specs>.*\.(?:spec|test)\.(?:ts|js)$)'
+    r'|(?P<elements>.*(?:^|[-_.])(?:element|elements)(?:[-_.]|$))'
+    r'|(?P<data>.*\.data\.(?:ts|js)$)'
+    r'|(?P<utils>.*(?:^|[-_.])(?:util|utils|helper|helpers)(?:[-_.]|$))'
+    r'|(?P<pages>.*(?:^|[-_.])(?:page|list-page|form-page)(?:[-_.]|$))'
+)
+SPEC_SUFFIX_RE = re.compile(r'\.spec\.(ts|js)$')
+TEST_SUFFIX_RE = re.compile(r'\.test\.(ts|js)$')
+JS_SUFFIX_RE = re.compile(r'\.js$')
+
+
+@dataclass(slots=True)
 class InventoryItem:
     source: str
     category: str
@@ -25,16 +38,8 @@ class InventoryItem:
     notes: list[str]
 
 
-def is_ignored(path: Path) -> bool:
-    return any(part in IGNORE_DIRS for part in path.parts)
-
-
-def classify(relative_path: Path) -> str:
-    parts = [part.lower() for part in relative_path.parts]
-    directories = parts[:-1]
-    name = relative_path.name.lower()
-
-    # 1) Directory-based classification has highest priority.
+def classify_by_directory(directories: tuple[str, ...]) -> str | None:
+    # Directory-based classification has highest priority.
     if 'specs' in directories:
         return 'specs'
     if 'pages' in directories:
@@ -45,19 +50,13 @@ def classify(relative_path: Path) -> str:
         return 'data'
     if 'utils' in directories:
         return 'utils'
+    return None
 
-    # 2) Filename-based fallback classification.
-    if re.search(r'\.(spec|test)\.(ts|js)$', name):
-        return 'specs'
-    if ELEMENTS_TOKEN_RE.search(name):
-        return 'elements'
-    if name.endswith('.data.ts') or name.endswith('.data.js'):
-        return 'data'
-    if UTILS_TOKEN_RE.search(name):
-        return 'utils'
-    if PAGES_TOKEN_RE.search(name):
-        return 'pages'
-    return 'other'
+
+def classify_by_name(name: str) -> str:
+    # Filename-based fallback classification.
+    match = CLASSIFY_NAME_RE.match(name)
+    return match.lastgroup if match else 'other'
 
 
 def normalize_filename(filename: str, category: str) -> tuple[str, list[str]]:
@@ -70,10 +69,10 @@ def normalize_filename(filename: str, category: str) -> tuple[str, list[str]]:
         notes.append('Convert JavaScript source to TypeScript.')
 
     if category == 'specs':
-        if re.search(r'\.spec\.(ts|js)$', lower_name):
-            normalized = re.sub(r'\.js$', '.ts', normalized)
-        elif re.search(r'\.test\.(ts|js)$', lower_name):
-            normalized = re.sub(r'\.test\.(ts|js)$', '.spec.ts', normalized)
+        if SPEC_SUFFIX_RE.search(lower_name):
+            normalized = JS_SUFFIX_RE.sub('.ts', normalized)
+        elif TEST_SUFFIX_RE.search(lower_name):
+            normalized = TEST_SUFFIX_RE.sub('.spec.ts', normalized)
             notes.append('Rename .test.* to .spec.ts to match repository convention.')
         elif normalized.endswith('.ts'):
             normalized = normalized[:-3] + '.spec.ts'
@@ -85,8 +84,7 @@ def normalize_filename(filename: str, category: str) -> tuple[str, list[str]]:
     return normalized, notes
 
 
-def nested_suffix(relative_path: Path, category: str) -> Path:
-    parts = list(relative_path.parts)
+def nested_suffix(dir_parts: tuple[str, ...], dirs_lower: tuple[str, ...], category: str) -> str:
     category_to_part = {
         'specs': 'specs',
         'pages': 'pages',
@@ -96,48 +94,87 @@ def nested_suffix(relative_path: Path, category: str) -> Path:
     }
     expected_part = category_to_part.get(category)
     if not expected_part:
-        return Path()
+        return ''
 
-    lowered = [part.lower() for part in parts]
-    if expected_part in lowered:
-        index = lowered.index(expected_part)
-        parent_parts = parts[index + 1 : -1]
-        return Path(*parent_parts) if parent_parts else Path()
+    if expected_part in dirs_lower:
+        index = dirs_lower.index(expected_part)
+        return os.sep.join(dir_parts[index + 1 :])
 
-    return Path()
+    return ''
 
 
-def propose_target(relative_path: Path, category: str, target_root: Path) -> tuple[Path, list[str]]:
-    normalized_name, notes = normalize_filename(relative_path.name, category)
-    nested_path = nested_suffix(relative_path, category)
+def propose_target(
+    dir_parts: tuple[str, ...],
+    dirs_lower: tuple[str, ...],
+    name: str,
+    category: str,
+    target_root: Path,
+) -> tuple[Path, list[str]]:
+    normalized_name, notes = normalize_filename(name, category)
+    nested_path = nested_suffix(dir_parts, dirs_lower, category)
 
     target_category = category if category in {'specs', 'pages', 'elements', 'data', 'utils', 'other'} else 'other'
     if category == 'other':
         notes.append('Category is ambiguous; manual placement review is required before implementation.')
 
     target = target_root / target_category
-    if str(nested_path) != '.':
+    if nested_path:
         target = target / nested_path
     target = target / normalized_name
     return target, notes
 
 
+def walk_code_files(source_root: Path) -> list[tuple[str, tuple[str, ...], tuple[str, ...], str]]:
+    # Explicit scandir-based walk so ignored directories are pruned before
+    # descent; rglob would stat every file under node_modules, .git, etc.
+    # Each entry carries (relative_str, dir_parts, dirs_lower, name) so the
+    # per-file loop never has to re-split or re-lowercase the path.
+    files: list[tuple[str, tuple[str, ...], tuple[str, ...], str]] = []
+    stack: list[tuple[str, str, tuple[str, ...], tuple[str, ...]]] = [(str(source_root), '', (), ())]
+
+    while stack:
+        dir_path, rel_prefix, dir_parts, dirs_lower = stack.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in IGNORE_DIRS:
+                        stack.append(
+                            (
+                                entry.path,
+                                rel_prefix + entry.name + os.sep,
+                                dir_parts + (entry.name,),
+                                dirs_lower + (entry.name.lower(),),
+                            )
+                        )
+                elif entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(CODE_EXTENSIONS):
+                    files.append((rel_prefix + entry.name, dir_parts, dirs_lower, entry.name))
+
+    files.sort()
+    return files
+
+
 def collect_inventory(source_root: Path, target_root: Path) -> list[InventoryItem]:
     items: list[InventoryItem] = []
+    # Sibling files share their directory verdict, so cache it per parent.
+    dir_category_cache: dict[tuple[str, ...], str | None] = {}
 
-    for file_path in sorted(source_root.rglob('*')):
-        if not file_path.is_file() or file_path.suffix.lower() not in CODE_EXTENSIONS:
-            continue
-        if is_ignored(file_path.relative_to(source_root)):
-            continue
+    for relative_str, dir_parts, dirs_lower, name in walk_code_files(source_root):
+        if dirs_lower in dir_category_cache:
+            dir_category = dir_category_cache[dirs_lower]
+        else:
+            dir_category = classify_by_directory(dirs_lower)
+            dir_category_cache[dirs_lower] = dir_category
 
-        relative_path = file_path.relative_to(source_root)
-        category = classify(relative_path)
-        target, notes = propose_target(relative_path, category, target_root)
+        category = dir_category if dir_category is not None else classify_by_name(name.lower())
+        target, notes = propose_target(dir_parts, dirs_lower, name, category, target_root)
 
         items.append(
             InventoryItem(
-                source=str(relative_path),
+                source=relative_str,
                 category=category,
                 target=str(target),
                 notes=notes,
@@ -147,39 +184,49 @@ def collect_inventory(source_root: Path, target_root: Path) -> list[InventoryIte
     return items
 
 
-def render_markdown(items: list[InventoryItem], source_root: Path, target_root: Path) -> str:
+def render_markdown(
+    items: list[InventoryItem],
+    source_root: Path,
+    target_root: Path,
+    stream: io.TextIOBase | None = None,
+) -> str | None:
+    # Rows are written straight to the stream (the report file when --output
+    # is given), so the table never lives in memory as a list of lines.
+    buffer = io.StringIO() if stream is None else None
+    write = (buffer if buffer is not None else stream).write
+
     counts = {category: 0 for category in CATEGORY_ORDER}
     for item in items:
         counts[item.category] += 1
 
-    lines: list[str] = []
-    lines.append('# Migration Inventory')
-    lines.append('')
-    lines.append(f'- Source: `{source_root}`')
-    lines.append(f'- Target: `{target_root}`')
-    lines.append(f'- Total code files: {len(items)}')
-    lines.append('')
-    lines.append('## Category Summary')
-    lines.append('')
+    write('# Migration Inventory\n')
+    write('\n')
+    write(f'- Source: `{source_root}`\n')
+    write(f'- Target: `{target_root}`\n')
+    write(f'- Total code files: {len(items)}\n')
+    write('\n')
+    write('## Category Summary\n')
+    write('\n')
     for category in CATEGORY_ORDER:
-        lines.append(f'- {category}: {counts[category]}')
-    lines.append('')
-    lines.append('## Proposed Mapping')
-    lines.append('')
-    lines.append('| Source | Category | Proposed Target | Notes |')
-    lines.append('|---|---|---|---|')
+        write(f'- {category}: {counts[category]}\n')
+    write('\n')
+    write('## Proposed Mapping\n')
+    write('\n')
+    write('| Source | Category | Proposed Target | Notes |\n')
+    write('|---|---|---|---|\n')
 
     for item in items:
         notes = '; '.join(item.notes)
-        lines.append(f'| `{item.source}` | `{item.category}` | `{item.target}` | {notes} |')
+        write(f'| `{item.source}` | `{item.category}` | `{item.target}` | {notes} |\n')
 
-    lines.append('')
-    lines.append('## Next Actions')
-    lines.append('')
-    lines.append('- Validate mapping for `other` category files manually.')
-    lines.append('- Confirm target paths stay inside `tests/_migrated/features/<feature>/...`.')
-    lines.append('- Use TestKit docs before applying migration edits.')
-    return '\n'.join(lines)
+    write('\n')
+    write('## Next Actions\n')
+    write('\n')
+    write('- Validate mapping for `other` category files manually.\n')
+    write('- Confirm target paths stay inside `tests/_migrated/features/<feature>/...`.\n')
+    write('- Use TestKit docs before applying migration edits.\n')
+
+    return buffer.getvalue() if buffer is not None else None
 
 
 def parse_args() -> argparse.Namespace:
@@ -202,23 +249,39 @@ def main() -> int:
 
     items = collect_inventory(source_root, target_root)
 
+    output_path: Path | None = None
+    if args.output:
+        output_path = Path(args.output).expanduser().resolve()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
     if args.format == 'json':
+        # Plain dict literals instead of dataclasses.asdict, which deep-copies
+        # and reflects over fields on every item.
         payload = {
             'source': str(source_root),
             'target': str(target_root),
             'total': len(items),
-            'items': [asdict(item) for item in items],
+            'items': [
+                {
+                    'source': item.source,
+                    'category': item.category,
+                    'target': item.target,
+                    'notes': item.notes,
+                }
+                for item in items
+            ],
         }
-        output = json.dumps(payload, indent=2)
-    else:
-        output = render_markdown(items, source_root, target_root)
-
-    if args.output:
-        output_path = Path(args.output).expanduser().resolve()
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(output + '\n', encoding='utf-8')
+        if output_path:
+            with output_path.open('w', encoding='utf-8') as stream:
+                json.dump(payload, stream, indent=2)
+                stream.write('\n')
+        else:
+            print(json.dumps(payload, indent=2))
+    elif output_path:
+        with output_path.open('w', encoding='utf-8') as stream:
+            render_markdown(items, source_root, target_root, stream)
     else:
-        print(output)
+        sys.stdout.write(render_markdown(items, source_root, target_root) or '')
 
     return 0
 